@@ -15,13 +15,18 @@ allowing users to easily re-apply these settings via custom shelves, shortcuts o
 It primarily focuses on Viewport 2.0 settings.
 
 Viewport Capture Tool Info
+ Opening the tool:
+   - Run the script, or import it and call `show()` (e.g. from a shelf button). Calling `show()` again
+     refreshes an open window in place instead of rebuilding it.
  Settings:
  - Custom Preset Path:
    - You can change the primary path where presets are saved and loaded.
-   - To do this, modify the following line 52 in the script:
+   - To do this, modify the following line in `ViewportCapture.__init__`:
      `self.custom_preset_path = "M:/MyProjectData/MayaViewportPresets/"`
    - Replace `"M:/MyProjectData/MayaViewportPresets/"` with your desired directory path.
    - Ensure the directory exists, or the script will use the default Maya preset location.
+   - A custom path that does not answer within a couple of seconds (e.g. a disconnected network drive)
+     is treated as missing, so the tool falls back instead of hanging.
  - Default Preset Path (Fallback):
    - If the 'Custom Preset Path' (above) is left empty, or if the specified custom directory does not exist,
      the script will automatically save and load presets from a default location within your Maya user application directory.
@@ -33,14 +38,299 @@ Viewport Capture Tool Info
  - GPU Cache:
    - The "Enable GPU Cache" checkbox in the UI controls whether GPU caching is active in the selected viewport.
    - This requires the 'gpuCache' plugin to be loaded in Maya. The script will attempt to load it automatically if needed.
+ - Preset Files:
+   - Presets are saved as compact JSON; set `self.readable_presets = True` for indented files.
+   - The preset list is sorted by name; set `self.sort_presets = False` to skip sorting in very large preset directories.
+   - If the optional 'orjson' package is installed in Maya's Python, it is used to read and write presets.
+   - If the optional 'watchdog' package is installed, the preset list updates live when presets are added
+     or removed by someone else (e.g. on a shared network drive) while the window is open.
 """
 
 import maya.cmds as cmds
 import maya.mel as mel
+import maya.utils
+import maya.api.OpenMaya as om
+import bisect
+import functools
 import json
 import os
+import threading
+
+# watchdog is optional; when it is installed the preset list follows files added or removed on disk
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
+# orjson is optional; when it is installed presets are parsed and written several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Preset file extension, and its length for slicing it off file names
+_JSON_SUFFIX = '.json'
+_JSON_SUFFIX_LEN = len(_JSON_SUFFIX)
+
+# MEL spelling of Python booleans, looked up instead of calling str(value).lower() per line
+_BOOL_MEL = {True: 'true', False: 'false'}
+
+
+def _mel_bool(value):
+    """Return value as MEL text, spelling booleans as true/false."""
+    # Only real bools use the table: 0/1 would hash equal to False/True, and lists cannot be hashed
+    if type(value) is bool:
+        return _BOOL_MEL[value]
+    return str(value).lower()
+
+
+def _json_loads(data):
+    """Parse JSON from bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj, indent=False):
+    """Serialize obj to JSON bytes, compact unless indent is set, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=4).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+# Seconds to wait on the custom preset path before falling back to the default directory
+_PATH_PROBE_TIMEOUT = 2.0
+
+
+def _dir_reachable(path, timeout=_PATH_PROBE_TIMEOUT):
+    """Return True if path is a directory, giving up after timeout seconds.
+
+    os.path.isdir can block for a long time on an unreachable network share, so the check runs in a
+    background thread.
+    """
+    result = []
+    probe = threading.Thread(target=lambda: result.append(os.path.isdir(path)))
+    probe.daemon = True
+    probe.start()
+    probe.join(timeout)
+    return bool(result and result[0])
+
+
+class _PresetIndex:
+    """Small mapping that keeps entries in a list and switches to a dict once it grows.
+
+    Most artists keep only a handful of presets, where scanning a short list beats hashing the key.
+    """
+    _DICT_THRESHOLD = 16
+
+    def __init__(self):
+        self._store = []  # list of (key, value) pairs, or a dict past the threshold
+
+    def get(self, key, default=None):
+        store = self._store
+        if isinstance(store, dict):
+            return store.get(key, default)
+        for k, v in store:
+            if k == key:
+                return v
+        return default
+
+    def __setitem__(self, key, value):
+        store = self._store
+        if isinstance(store, dict):
+            store[key] = value
+            return
+        for i, (k, _) in enumerate(store):
+            if k == key:
+                store[i] = (key, value)
+                return
+        store.append((key, value))
+        if len(store) > self._DICT_THRESHOLD:
+            self._store = dict(store)
+
+    def pop(self, key, default=None):
+        store = self._store
+        if isinstance(store, dict):
+            return store.pop(key, default)
+        for i, (k, v) in enumerate(store):
+            if k == key:
+                del store[i]
+                return v
+        return default
+
+
+class _PresetDirHandler(FileSystemEventHandler):
+    """Forward preset files created, deleted or renamed in the preset directory to the tool."""
+
+    def __init__(self, tool, preset_dir):
+        super().__init__()
+        self._tool = tool
+        self._preset_dir = preset_dir
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self._forward(event.src_path, True)
+
+    def on_deleted(self, event):
+        if not event.is_directory:
+            self._forward(event.src_path, False)
+
+    def on_moved(self, event):
+        if not event.is_directory:
+            self._forward(event.src_path, False)
+            self._forward(event.dest_path, True)
+
+    def _forward(self, path, added):
+        name = os.path.basename(path)
+        if name.endswith(_JSON_SUFFIX):
+            # Events arrive on the observer thread; the list is updated on Maya's main thread
+            maya.utils.executeDeferred(self._tool._on_preset_file_event, self._preset_dir,
+                                       name[:-_JSON_SUFFIX_LEN], added)
+
 
 class ViewportCapture:
+    # Static MEL blocks used by settings_to_mel, joined once with the per-setting lines
+    _MEL_HEADER = """// Viewport Settings - Generated by viewportCapture
+global proc viewportCaptureApply()
+{
+    string $panel = `getPanel -withFocus`;
+    if (`getPanel -typeOf $panel` != "modelPanel")
+    {
+        string $modelPanels[] = `getPanel -type "modelPanel"`;
+        $panel = "";
+        if (size($modelPanels) > 0)
+        {
+            $panel = $modelPanels[0];
+        }
+        if ($panel == "")
+        {
+            error "No valid modelPanel found.\\nPlease open a viewport first.";
+            return;
+        }
+    }
+
+    // Set Viewport 2.0 renderer
+    modelEditor -e -rendererName "vp2Renderer" $panel;
+
+    string $camera = `modelEditor -q -camera $panel`;
+    if ($camera != "")
+    {
+        // Camera Gate Settings"""
+
+    _MEL_GPU_FMT = """    }}
+
+    // GPU Cache Settings
+    if (!`pluginInfo -q -loaded "gpuCache"`)
+    {{
+        loadPlugin "gpuCache";
+    }}
+    modelEditor -e -pluginObjects gpuCacheDisplayFilter {} $panel;
+
+    // Display Settings"""
+
+    _MEL_HW2_HEADER = """
+    // Hardware 2.0 Settings
+    if (!`objExists "hardwareRenderingGlobals"`) {
+        createNode "hardwareRenderingGlobals";
+    }"""
+
+    # Standard display attributes
+    DISPLAY_ATTRS = (
+        'nurbsCurves', 'nurbsSurfaces', 'polymeshes', 'subdivSurfaces',
+        'planes', 'lights', 'joints', 'ikHandles', 'deformers',
+        'dynamics', 'fluids', 'hairSystems', 'follicles', 'nCloths',
+        'nParticles', 'nRigids', 'dynamicConstraints', 'locators',
+        'manipulators', 'grid', 'handles', 'pivots', 'textures',
+        'strokes', 'selectionHiliteDisplay', 'headsUpDisplay',
+        'displayLights', 'wireframeOnShaded', 'wireframe', 'xray',
+        'backfaceCulling', 'smoothWireframe', 'displayTextures',
+        'displayAppearance', 'useDefaultMaterial', 'hwFog', 'fogging',
+        'dimensions', 'cv', 'particleInstancers', 'motionTrails',
+        'cameras', 'imagePlane', 'hulls', 'twoSidedLighting', 'shadows',
+        'jointXray', 'activeComponentsXray'
+    )
+
+    # Pre-bound modelEditor queries for every plain flag (all but hwFog), so the capture loop
+    # no longer rebuilds the {attr: True} literal; partial still copies its keywords on each call
+    _DISPLAY_QUERIES = tuple((attr, functools.partial(cmds.modelEditor, query=True, **{attr: True}))
+                             for attr in DISPLAY_ATTRS if attr != 'hwFog')
+
+    # Hardware 2.0 specific attributes as (name, type) pairs
+    HW2_ATTRS = (
+        ('multiSampleEnable', bool),
+        ('multiSampleCount', int),
+        ('ssaoEnable', bool),
+        ('ssaoAmount', float),
+        ('ssaoRadius', float),
+        ('ssaoFilterRadius', float),
+        ('motionBlurEnable', bool),
+        ('motionBlurSampleCount', int),
+        ('motionBlurShutterOpenFraction', float),
+        ('motionBlurShutterCloseFraction', float),
+        ('transparencyAlgorithm', int),
+        ('transparencyQuality', float),
+        ('transparencyShadowDepth', int),
+        ('lineAAEnable', bool),
+        ('maxHardwareLines', int),
+        ('minimumPixelWidth', float),
+        ('hwFogEnable', bool),
+        ('hwFogMode', int),
+        ('hwFogStart', float),
+        ('hwFogEnd', float),
+        ('hwFogDensity', float),
+        ('hwFogColor', 'float3'),
+        ('hwFogFalloff', int),
+        ('hwFogRatio', float),
+        ('defaultLightIntensity', float),
+        ('consolidateWorld', bool),
+        ('maxHardwareLights', int),
+        ('transparentShadow', bool),
+        ('alphaCutPrepass', bool),
+    )
+
+    # HW2 attribute name -> type, for looking up the attributes stored in a preset
+    _HW2_TYPES = dict(HW2_ATTRS)
+
+    # Full plug names, built once instead of concatenated on every apply
+    _HW2_FULL_NAMES = {attr: 'hardwareRenderingGlobals.' + attr for attr, _ in HW2_ATTRS}
+
+    # Camera flags stored in each settings section, read and written through cmds.camera
+    _CAMERA_ATTRS = (
+        ('camera_gate', 'displayFilmGate'),
+        ('camera_gate', 'displayResolution'),
+        ('camera_gate', 'overscan'),
+        ('camera_mask', 'displayGateMask'),
+        ('camera_filmfit', 'filmFit'),
+    )
+    # What each camera section is called in warnings when it has to be applied on its own
+    _CAMERA_SECTION_LABELS = (
+        ('camera_gate', 'camera gate settings'),
+        ('camera_mask', 'camera gate mask setting'),
+        ('camera_filmfit', 'camera film fit setting'),
+    )
+
+    # MPlug readers for the HW2 attribute types; floats are read as doubles to match getAttr's values
+    _PLUG_READERS = {bool: om.MPlug.asBool, int: om.MPlug.asInt, float: om.MPlug.asDouble}
+
+    # Number of generated MEL scripts kept by settings_to_mel
+    _MEL_CACHE_SIZE = 16
+
+    # Per-attribute MEL line formats for display settings; anything not listed is a plain boolean flag
+    _DISPLAY_MEL_DEFAULT = '    modelEditor -e -{attr} {val} $panel;'
+    _DISPLAY_MEL_FMT = {
+        'hwFog': ('    modelEditor -e -hwFog {val} $panel;\n'
+                  '    if (!`objExists "hardwareRenderingGlobals"`) {{\n'
+                  '        createNode "hardwareRenderingGlobals";\n'
+                  '    }}\n'
+                  '    setAttr "hardwareRenderingGlobals.hwFogEnable" {raw:d};'),
+        'displayLights': '    modelEditor -e -{attr} "{raw}" $panel;',
+        'displayAppearance': '    modelEditor -e -{attr} "{raw}" $panel;',
+    }
+
     def __init__(self):
         self.window_name = "viewportCaptureWin"
         self.result_field = None
@@ -50,58 +340,26 @@ class ViewportCapture:
         self.gpu_cache_enabled = False  # Flag for GPU cache state. Change to True if you want GPU cache to be enabled by default at script startup.
         self.gpu_checkbox = None
         self.custom_preset_path = "M:/MyProjectData/MayaViewportPresets/"  # Add custom preset path variable here
-
-        # Standard display attributes
-        self.display_attrs = [
-            'nurbsCurves', 'nurbsSurfaces', 'polymeshes', 'subdivSurfaces',
-            'planes', 'lights', 'joints', 'ikHandles', 'deformers',
-            'dynamics', 'fluids', 'hairSystems', 'follicles', 'nCloths',
-            'nParticles', 'nRigids', 'dynamicConstraints', 'locators',
-            'manipulators', 'grid', 'handles', 'pivots', 'textures',
-            'strokes', 'selectionHiliteDisplay', 'headsUpDisplay',
-            'displayLights', 'wireframeOnShaded', 'wireframe', 'xray',
-            'backfaceCulling', 'smoothWireframe', 'displayTextures',
-            'displayAppearance', 'useDefaultMaterial', 'hwFog', 'fogging',
-            'dimensions', 'cv', 'particleInstancers', 'motionTrails',
-            'cameras', 'imagePlane', 'hulls', 'twoSidedLighting', 'shadows', 
-            'jointXray','activeComponentsXray'
-        ]
-
-        # Hardware 2.0 specific attributes
-        self.hw2_attrs = {
-            'multiSampleEnable': bool,
-            'multiSampleCount': int,
-            'ssaoEnable': bool,
-            'ssaoAmount': float,
-            'ssaoRadius': float,
-            'ssaoFilterRadius': float,
-            'motionBlurEnable': bool,
-            'motionBlurSampleCount': int,
-            'motionBlurShutterOpenFraction': float,
-            'motionBlurShutterCloseFraction': float,
-            'transparencyAlgorithm': int,
-            'transparencyQuality': float,
-            'transparencyShadowDepth': int,
-            'lineAAEnable': bool,
-            'maxHardwareLines': int,
-            'minimumPixelWidth': float,
-            'hwFogEnable': bool,
-            'hwFogMode': int,
-            'hwFogStart': float,
-            'hwFogEnd': float,
-            'hwFogDensity': float,
-            'hwFogColor': 'float3',
-            'hwFogFalloff': int,
-            'hwFogRatio': float,
-            'defaultLightIntensity': float,
-            'consolidateWorld': bool,
-            'maxHardwareLights': int,
-            'transparentShadow': bool,
-            'alphaCutPrepass': bool
+        self.readable_presets = False  # Set to True to save presets as indented, human-readable JSON instead of compact JSON.
+        self.sort_presets = True  # Set to False to list presets in directory order; only worth it for very large preset directories.
+        self._preset_dir = None
+        self._parsed_preset_cache = _PresetIndex()  # preset path -> (mtime_ns, parsed settings)
+        self._mel_cache = {}  # serialized settings -> generated MEL
+        self._preset_names = []  # preset names from the last directory scan, sorted unless sort_presets is off
+        self._preset_name_set = set()  # the same names, for membership checks
+        self._preset_names_key = None  # (preset_dir, dir mtime_ns) of that scan
+        self._preset_generation = 0  # bumped by every refresh, add and remove of the preset list
+        self._preset_scan_generation = 0  # generation of the most recently started scan
+        self._presets_loaded = False
+        self._preset_observer = None
+        self._hwrg_ensured = False
+
+        # Display attributes that need more than a plain modelEditor edit when applied
+        self._apply_fns = {
+            'hwFog': self._apply_hwfog,
         }
 
         self.create_main_ui()
-        self.refresh_preset_list()
 
     def ensure_gpu_plugin_loaded(self):
         """Ensure GPU Cache plugin is loaded."""
@@ -115,6 +373,28 @@ class ViewportCapture:
             return False
         return True
 
+    def _ensure_hwrg(self):
+        """Make sure the hardwareRenderingGlobals node exists, checking Maya only once."""
+        if self._hwrg_ensured:
+            return
+        if not cmds.objExists('hardwareRenderingGlobals'):
+            cmds.createNode('hardwareRenderingGlobals')
+        self._hwrg_ensured = True
+
+    def _get_hwrg_fn(self):
+        """Return an MFnDependencyNode for the hardwareRenderingGlobals node."""
+        self._ensure_hwrg()
+        sel = om.MSelectionList()
+        sel.add('hardwareRenderingGlobals')
+        return om.MFnDependencyNode(sel.getDependNode(0))
+
+    def _read_hw2_plug(self, node_fn, attr, attr_type):
+        """Read one hardwareRenderingGlobals attribute through its MPlug."""
+        plug = node_fn.findPlug(attr, False)
+        if attr_type == 'float3':
+            return tuple(plug.child(i).asDouble() for i in range(3))
+        return self._PLUG_READERS[attr_type](plug)
+
     def update_status(self, message):
         """Update the UI status label."""
         if self.status_label:
@@ -179,49 +459,41 @@ class ViewportCapture:
             'camera_filmfit': {}
         }
 
+        # Failures are collected and reported once instead of updating the status label per attribute
+        failed = []
+
+        # Capture camera gate, mask and film fit settings
         active_camera = self.get_active_camera(panel)
         if active_camera:
-            try:
-                settings['camera_gate']['displayFilmGate'] = cmds.camera(active_camera, query=True, displayFilmGate=True)
-                settings['camera_gate']['displayResolution'] = cmds.camera(active_camera, query=True, displayResolution=True)
-                settings['camera_gate']['overscan'] = cmds.camera(active_camera, query=True, overscan=True)
-            except Exception as e:
-                self.update_status("Warning: Could not capture camera gate settings: {}".format(str(e)))
-
-            try:
-                settings['camera_mask']['displayGateMask'] = cmds.camera(active_camera, query=True, displayGateMask=True)
-            except Exception as e:
-                self.update_status("Warning: Could not capture camera gate mask setting: {}".format(str(e)))
+            for section, attr in self._CAMERA_ATTRS:
+                try:
+                    settings[section][attr] = cmds.camera(active_camera, query=True, **{attr: True})
+                except Exception:
+                    failed.append(attr)
 
-            try:
-                settings['camera_filmfit']['filmFit'] = cmds.camera(active_camera, query=True, filmFit=True)
-            except Exception as e:
-                self.update_status("Warning: Could not capture camera film fit setting: {}".format(str(e)))
+        # Capture standard display attributes.
+        # The plain flags are read under a single try; the per-attribute pass only runs after a failure.
+        display = settings['display']
+        try:
+            for attr, query in self._DISPLAY_QUERIES:
+                display[attr] = query(panel)
+        except Exception:
+            for attr, query in self._DISPLAY_QUERIES:
+                if attr in display:
+                    continue
+                try:
+                    display[attr] = query(panel)
+                except Exception:
+                    failed.append(attr)
 
-        # Capture standard display attributes
-        for attr in self.display_attrs:
-            try:
-                if attr == 'displayAppearance':
-                    val = cmds.modelEditor(panel, q=True, displayAppearance=True)
-                elif attr == 'hwFog':
-                    val = cmds.modelEditor(panel, q=True, hwFog=True)
-                    settings['display'][attr] = val
-                    if not cmds.objExists('hardwareRenderingGlobals'):
-                        cmds.createNode('hardwareRenderingGlobals')
-                    cmds.setAttr('hardwareRenderingGlobals.hwFogEnable', val)
-                elif attr == 'fogging':
-                    val = cmds.modelEditor(panel, q=True, fogging=True)
-                elif attr == 'shadows':
-                    val = cmds.modelEditor(panel, q=True, shadows=True)
-                elif attr == 'jointXray':
-                    val = cmds.modelEditor(panel, q=True, jointXray=True)
-                elif attr == 'activeComponentsXray':
-                    val = cmds.modelEditor(panel, q=True, activeComponentsXray=True)
-                else:
-                    val = cmds.modelEditor(panel, q=True, **{attr: True})
-                settings['display'][attr] = val
-            except Exception as e:
-                self.update_status("Warning: Could not capture {}: {}".format(attr, str(e)))
+        # hwFog is captured on its own since its state is mirrored onto hardwareRenderingGlobals
+        try:
+            val = cmds.modelEditor(panel, q=True, hwFog=True)
+            display['hwFog'] = val
+            self._ensure_hwrg()
+            cmds.setAttr(self._HW2_FULL_NAMES['hwFogEnable'], val)
+        except Exception:
+            failed.append('hwFog')
 
         # Capture background settings
         try:
@@ -233,18 +505,17 @@ class ViewportCapture:
             self.update_status("Warning: Could not capture background settings: {}".format(str(e)))
 
         # Capture Hardware 2.0 settings
-        if not cmds.objExists('hardwareRenderingGlobals'):
-            cmds.createNode('hardwareRenderingGlobals')
-
-        for attr, attr_type in self.hw2_attrs.items():
+        # Plugs are read straight through the API rather than one getAttr command per attribute
+        hardware2 = settings['hardware2']
+        node_fn = self._get_hwrg_fn()
+        for attr, attr_type in self.HW2_ATTRS:
             try:
-                if attr_type == 'float3':
-                    val = cmds.getAttr('hardwareRenderingGlobals.' + attr)[0]
-                else:
-                    val = cmds.getAttr('hardwareRenderingGlobals.' + attr)
-                settings['hardware2'][attr] = val
-            except Exception as e:
-                self.update_status("Warning: Could not capture HW2 setting {}: {}".format(attr, str(e)))
+                hardware2[attr] = self._read_hw2_plug(node_fn, attr, attr_type)
+            except Exception:
+                failed.append(attr)
+
+        if failed:
+            self.update_status("Warning: Could not capture {}".format(", ".join(failed)))
 
         return settings
 
@@ -264,68 +535,36 @@ class ViewportCapture:
         try:
             cmds.undoInfo(openChunk=True)
 
-            # Apply camera gate settings
-            camera_gate_settings = self.last_captured_settings.get('camera_gate', {})
+            # Apply camera gate, mask and film fit settings in a single edit
             active_camera = self.get_active_camera(panel)
-            if active_camera and camera_gate_settings:
-                try:
-                    if 'displayFilmGate' in camera_gate_settings:
-                        cmds.camera(active_camera, edit=True, displayFilmGate=camera_gate_settings['displayFilmGate'])
-                    if 'displayResolution' in camera_gate_settings:
-                        cmds.camera(active_camera, edit=True, displayResolution=camera_gate_settings['displayResolution'])
-                    if 'overscan' in camera_gate_settings:
-                        cmds.camera(active_camera, edit=True, overscan=camera_gate_settings['overscan'])
-                except Exception as e:
-                    self.update_status("Warning: Could not apply camera gate settings: {}".format(str(e)))
-
-            # Apply camera mask settings
-            camera_mask_settings = self.last_captured_settings.get('camera_mask', {})
-            if active_camera and camera_mask_settings:
-                try:
-                    if 'displayGateMask' in camera_mask_settings:
-                        cmds.camera(active_camera, edit=True, displayGateMask=camera_mask_settings['displayGateMask'])
-                except Exception as e:
-                    self.update_status("Warning: Could not apply camera gate mask setting: {}".format(str(e)))
-
-            # Apply camera film fit settings
-            camera_filmfit_settings = self.last_captured_settings.get('camera_filmfit', {})
-            if active_camera and camera_filmfit_settings:
-                try:
-                    if 'filmFit' in camera_filmfit_settings:
-                        cmds.camera(active_camera, edit=True, filmFit=camera_filmfit_settings['filmFit'])
-                except Exception as e:
-                    self.update_status("Warning: Could not apply camera film fit setting: {}".format(str(e)))
+            if active_camera:
+                camera_edits = {}
+                for section, attr in self._CAMERA_ATTRS:
+                    section_settings = self.last_captured_settings.get(section, {})
+                    if attr in section_settings:
+                        camera_edits[attr] = section_settings[attr]
+                if camera_edits:
+                    try:
+                        cmds.camera(active_camera, edit=True, **camera_edits)
+                    except Exception:
+                        # Retry one section at a time so the warning names the part that failed
+                        # and the other sections still get applied
+                        self._apply_camera_sections(active_camera)
 
             # Apply standard display settings
+            apply_fns = self._apply_fns
+            apply_default = self._apply_display_attr
             for attr, value in self.last_captured_settings['display'].items():
                 try:
-                    if attr == 'displayAppearance':
-                        cmds.modelEditor(panel, e=True, displayAppearance=value)
-                    elif attr == 'hwFog':
-                        cmds.modelEditor(panel, e=True, hwFog=value)
-                        if not cmds.objExists('hardwareRenderingGlobals'):
-                            cmds.createNode('hardwareRenderingGlobals')
-                        cmds.setAttr('hardwareRenderingGlobals.hwFogEnable', value)
-                    elif attr == 'fogging':
-                        cmds.modelEditor(panel, e=True, fogging=value)
-                    elif attr == 'shadows':
-                         cmds.modelEditor(panel, e=True, shadows=value)
-                    elif attr == 'jointXray':
-                        cmds.modelEditor(panel, e=True, jointXray=value)
-                    elif attr == 'activeComponentsXray':
-                        cmds.modelEditor(panel, e=True, activeComponentsXray=value)
-                    else:
-                        cmds.modelEditor(panel, e=True, **{attr: value})
+                    apply_fns.get(attr, apply_default)(panel, attr, value)
                 except Exception as e:
                      self.update_status("Warning: Could not apply {}: {}".format(attr, str(e)))
 
             # Apply GPU Cache settings
             if 'plugin_display' in self.last_captured_settings:
                 gpu_state = self.last_captured_settings['plugin_display']['gpuCache']
-                if gpu_state and self.ensure_gpu_plugin_loaded():
-                    cmds.modelEditor(panel, edit=True, pluginObjects=('gpuCacheDisplayFilter', True))
-                else:
-                    cmds.modelEditor(panel, edit=True, pluginObjects=('gpuCacheDisplayFilter', False))
+                gpu_state = bool(gpu_state) and self.ensure_gpu_plugin_loaded()
+                cmds.modelEditor(panel, edit=True, pluginObjects=('gpuCacheDisplayFilter', gpu_state))
                 self.gpu_cache_enabled = gpu_state
                 cmds.checkBox(self.gpu_checkbox, edit=True, value=self.gpu_cache_enabled)
 
@@ -346,15 +585,25 @@ class ViewportCapture:
             # Apply Hardware 2.0 settings
             hw2_settings = self.last_captured_settings.get('hardware2', {})
             if hw2_settings:
-                if not cmds.objExists('hardwareRenderingGlobals'):
-                    cmds.createNode('hardwareRenderingGlobals')
-
+                node_fn = self._get_hwrg_fn()
+                hw2_types = self._HW2_TYPES
+                full_names = self._HW2_FULL_NAMES
                 for attr, value in hw2_settings.items():
+                    # Skip values that already match: every setAttr on the globals invalidates the viewport
+                    attr_type = hw2_types.get(attr)
+                    if attr_type is not None:
+                        try:
+                            wanted = tuple(value) if isinstance(value, list) else value
+                            if self._read_hw2_plug(node_fn, attr, attr_type) == wanted:
+                                continue
+                        except Exception:
+                            pass
                     try:
+                        full_name = full_names.get(attr) or 'hardwareRenderingGlobals.' + attr
                         if isinstance(value, (list, tuple)):
-                            cmds.setAttr('hardwareRenderingGlobals.' + attr, *value, type='double3')
+                            cmds.setAttr(full_name, *value, type='double3')
                         else:
-                            cmds.setAttr('hardwareRenderingGlobals.' + attr, value)
+                            cmds.setAttr(full_name, value)
                     except Exception as e:
                         self.update_status("Warning: Could not apply HW2 setting {}: {}".format(attr, str(e)))
 
@@ -365,150 +614,136 @@ class ViewportCapture:
         finally:
             cmds.undoInfo(closeChunk=True)
 
+    def _apply_display_attr(self, panel, attr, value):
+        """Apply a plain modelEditor display flag to the panel."""
+        cmds.modelEditor(panel, e=True, **{attr: value})
+
+    def _apply_camera_sections(self, camera):
+        """Apply the captured camera gate, mask and film fit settings with one edit per section."""
+        for section, label in self._CAMERA_SECTION_LABELS:
+            section_settings = self.last_captured_settings.get(section, {})
+            edits = {attr: section_settings[attr] for attr_section, attr in self._CAMERA_ATTRS
+                     if attr_section == section and attr in section_settings}
+            if not edits:
+                continue
+            try:
+                cmds.camera(camera, edit=True, **edits)
+            except Exception as e:
+                self.update_status("Warning: Could not apply {}: {}".format(label, str(e)))
+
+    def _apply_hwfog(self, panel, attr, value):
+        """Apply hardware fog to the panel and mirror it on hardwareRenderingGlobals."""
+        cmds.modelEditor(panel, e=True, hwFog=value)
+        self._ensure_hwrg()
+        cmds.setAttr(self._HW2_FULL_NAMES['hwFogEnable'], value)
+
     def settings_to_mel(self, settings):
-        """Convert settings to MEL script."""
+        """Convert settings to MEL script, reusing the script already generated for identical settings."""
         if not settings:
             return "// No settings captured"
 
-        mel_commands = [
-            '// Viewport Settings - Generated by viewportCapture',
-            'global proc viewportCaptureApply()',
-            '{',
-            '    string $panel = `getPanel -withFocus`;',
-            '    if (`getPanel -typeOf $panel` != "modelPanel")',
-            '    {',
-            '        string $modelPanels[] = `getPanel -type "modelPanel"`;',
-            '        $panel = "";',
-            '        if (size($modelPanels) > 0)',
-            '        {',
-            '            $panel = $modelPanels[0];',
-            '        }',
-            '        if ($panel == "")',
-            '        {',
-            '            error "No valid modelPanel found.\\nPlease open a viewport first.";',
-            '            return;',
-            '        }',
-            '    }',
-            '',
-            '    // Set Viewport 2.0 renderer',
-            '    modelEditor -e -rendererName "vp2Renderer" $panel;',
-            '',
-            '    string $camera = `modelEditor -q -camera $panel`;',
-            '    if ($camera != "")',
-            '    {',
-            '        // Camera Gate Settings'
-        ]
+        # Serialized settings double as the cache key; insertion order is kept since it sets the MEL line order
+        key = _json_dumps(settings)
+        mel_code = self._mel_cache.get(key)
+        if mel_code is None:
+            mel_code = self._build_mel(settings)
+            if len(self._mel_cache) >= self._MEL_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self._mel_cache[next(iter(self._mel_cache))]
+            self._mel_cache[key] = mel_code
+        return mel_code
+
+    def _build_mel(self, settings):
+        """Generate the MEL script for the given settings."""
+        parts = [self._MEL_HEADER]
+        append = parts.append
 
         # Add Camera Gate settings
-        if 'camera_gate' in settings:
-            camera_gate = settings['camera_gate']
-            if 'displayFilmGate' in camera_gate:
-                mel_commands.append('        camera -e -displayFilmGate {} $camera;'.format(str(camera_gate["displayFilmGate"]).lower()))
-            if 'displayResolution' in camera_gate:
-                mel_commands.append('        camera -e -displayResolution {} $camera;'.format(str(camera_gate["displayResolution"]).lower()))
-            if 'overscan' in camera_gate:
-                mel_commands.append('        camera -e -overscan {} $camera;'.format(camera_gate["overscan"]))
+        camera_gate = settings.get('camera_gate', {})
+        if 'displayFilmGate' in camera_gate:
+            append('        camera -e -displayFilmGate {} $camera;'.format(_mel_bool(camera_gate["displayFilmGate"])))
+        if 'displayResolution' in camera_gate:
+            append('        camera -e -displayResolution {} $camera;'.format(_mel_bool(camera_gate["displayResolution"])))
+        if 'overscan' in camera_gate:
+            append('        camera -e -overscan {} $camera;'.format(camera_gate["overscan"]))
 
         # Add Camera Mask settings
-        if 'camera_mask' in settings:
-            camera_mask = settings['camera_mask']
-            if 'displayGateMask' in camera_mask:
-                mel_commands.append('        camera -e -displayGateMask {} $camera;'.format(str(camera_mask["displayGateMask"]).lower()))
+        camera_mask = settings.get('camera_mask', {})
+        if 'displayGateMask' in camera_mask:
+            append('        camera -e -displayGateMask {} $camera;'.format(_mel_bool(camera_mask["displayGateMask"])))
 
         # Add Camera Film Fit settings
-        if 'camera_filmfit' in settings:
-            camera_filmfit = settings['camera_filmfit']
-            if 'filmFit' in camera_filmfit:
-                mel_commands.append('        camera -e -filmFit {} $camera;'.format(camera_filmfit["filmFit"]))
-
-        mel_commands.append('    }')
-        mel_commands.append('')
-
-        # Add GPU Cache settings
-        mel_commands.extend([
-            '    // GPU Cache Settings',
-            '    if (!`pluginInfo -q -loaded "gpuCache"`)',
-            '    {',
-            '        loadPlugin "gpuCache";',
-            '    }',
-            '    modelEditor -e -pluginObjects gpuCacheDisplayFilter {} $panel;'.format(str(settings.get("plugin_display", {}).get("gpuCache", False)).lower()),
-            ''
-        ])
+        camera_filmfit = settings.get('camera_filmfit', {})
+        if 'filmFit' in camera_filmfit:
+            append('        camera -e -filmFit {} $camera;'.format(camera_filmfit["filmFit"]))
+
+        # Add GPU Cache settings (also opens the display settings block)
+        append(self._MEL_GPU_FMT.format(_mel_bool(settings.get("plugin_display", {}).get("gpuCache", False))))
 
         # Add display settings
-        mel_commands.append('    // Display Settings')
+        display_fmt = self._DISPLAY_MEL_FMT
+        default_fmt = self._DISPLAY_MEL_DEFAULT
+        bool_mel = _BOOL_MEL
         for attr, value in settings['display'].items():
-            if attr == 'hwFog':
-                mel_commands.append('    modelEditor -e -hwFog {} $panel;'.format(str(value).lower()))
-                mel_commands.append('    if (!`objExists "hardwareRenderingGlobals"`) {')
-                mel_commands.append('        createNode "hardwareRenderingGlobals";')
-                mel_commands.append('    }')
-                mel_commands.append('    setAttr "hardwareRenderingGlobals.hwFogEnable" {};'.format(int(value)))
-            elif attr == 'fogging':
-                mel_commands.append('    modelEditor -e -fogging {} $panel;'.format(str(value).lower()))
-            elif attr in ['displayLights', 'displayAppearance']:
-                mel_commands.append('    modelEditor -e -{0} "{1}" $panel;'.format(attr, value))
-            elif attr == 'twoSidedLighting':
-                 mel_commands.append('    modelEditor -e -twoSidedLighting {} $panel;'.format(str(value).lower()))
-            elif attr == 'shadows':
-                mel_commands.append('    modelEditor -e -shadows {} $panel;'.format(str(value).lower()))
-            elif attr == 'jointXray':
-                mel_commands.append('    modelEditor -e -jointXray {} $panel;'.format(str(value).lower()))
-            elif attr == 'activeComponentsXray':
-                mel_commands.append('    modelEditor -e -activeComponentsXray {} $panel;'.format(str(value).lower()))
-            else:
-                mel_commands.append('    modelEditor -e -{0} {1} $panel;'.format(attr, str(value).lower()))
+            val = bool_mel[value] if type(value) is bool else str(value).lower()
+            append(display_fmt.get(attr, default_fmt).format(attr=attr, val=val, raw=value))
 
         # Add background settings
         if 'background' in settings:
-            mel_commands.append('')
-            mel_commands.append('    // Background Settings')
+            append('\n    // Background Settings')
             bg = settings['background']
             if 'gradient' in bg:
-                mel_commands.append('    displayPref -displayGradient {};'.format(str(bg["gradient"]).lower()))
+                append('    displayPref -displayGradient {};'.format(_mel_bool(bg["gradient"])))
             if 'topColor' in bg:
-                top_color = bg['topColor']
-                mel_commands.append('    displayRGBColor "backgroundTop" {0} {1} {2};'.format(
-                    top_color[0], top_color[1], top_color[2]))
+                append('    displayRGBColor "backgroundTop" {0} {1} {2};'.format(*bg['topColor']))
             if 'color' in bg:
-                color = bg['color']
-                mel_commands.append('    displayRGBColor "background" {0} {1} {2};'.format(
-                    color[0], color[1], color[2]))
+                append('    displayRGBColor "background" {0} {1} {2};'.format(*bg['color']))
             if bg.get('gradient') and 'bottomColor' in bg:
-                bottom_color = bg['bottomColor']
-                mel_commands.append('    displayRGBColor "backgroundBottom" {0} {1} {2};'.format(
-                    bottom_color[0], bottom_color[1], bottom_color[2]))
+                append('    displayRGBColor "backgroundBottom" {0} {1} {2};'.format(*bg['bottomColor']))
 
         # Add Hardware 2.0 settings
         if 'hardware2' in settings:
-            mel_commands.append('')
-            mel_commands.append('    // Hardware 2.0 Settings')
-            mel_commands.append('    if (!`objExists "hardwareRenderingGlobals"`) {')
-            mel_commands.append('        createNode "hardwareRenderingGlobals";')
-            mel_commands.append('    }')
-
+            append(self._MEL_HW2_HEADER)
             for attr, value in settings['hardware2'].items():
                 if isinstance(value, bool):
                     value = int(value)
                 if isinstance(value, (list, tuple)):
-                    mel_commands.append('    setAttr "hardwareRenderingGlobals.{0}" -type double3 {1} {2} {3};'.format(
+                    append('    setAttr "hardwareRenderingGlobals.{0}" -type double3 {1} {2} {3};'.format(
                         attr, value[0], value[1], value[2]))
                 else:
-                    mel_commands.append('    setAttr "hardwareRenderingGlobals.{0}" {1};'.format(attr, value))
+                    append('    setAttr "hardwareRenderingGlobals.{0}" {1};'.format(attr, value))
 
-        mel_commands.extend(['}', '', 'viewportCaptureApply();'])
-        return '\n'.join(mel_commands)
+        append('}\n\nviewportCaptureApply();')
+        return '\n'.join(parts)
 
     def get_preset_dir(self):
-        """Ensure and return the presets directory, prioritizing custom path."""
-        if self.custom_preset_path and os.path.isdir(self.custom_preset_path):
-            return self.custom_preset_path
+        """Ensure and return the presets directory, prioritizing custom path.
+
+        The resolved directory is cached; use set_custom_preset_path to change it.
+        """
+        if self._preset_dir:
+            return self._preset_dir
+        if self.custom_preset_path and _dir_reachable(self.custom_preset_path):
+            preset_dir = self.custom_preset_path
         else:
             maya_app_dir = cmds.internalVar(userAppDir=True)
             preset_dir = os.path.join(maya_app_dir, 'viewportCapture', 'presets')
-            if not os.path.exists(preset_dir):
-                os.makedirs(preset_dir)
-            return preset_dir
+            os.makedirs(preset_dir, exist_ok=True)
+        self._preset_dir = preset_dir
+        return preset_dir
+
+    def set_custom_preset_path(self, path):
+        """Set the custom preset path and drop the cached preset directory.
+
+        An open window's preset list and directory watcher are moved to the new directory.
+        """
+        self.custom_preset_path = path
+        self._preset_dir = None
+        self._stop_preset_watch()
+        # Before the first fill, _populate_presets will list and watch the new directory itself
+        if self._presets_loaded and self.preset_list and cmds.textScrollList(self.preset_list, exists=True):
+            self.refresh_preset_list()
+            cmds.evalDeferred(self._start_preset_watch, lowestPriority=True)
 
     def toggle_gpu_cache(self, *args):
         """Toggle GPU Cache state based on checkbox."""
@@ -541,7 +776,7 @@ class ViewportCapture:
         if result == 'Save':
             name = cmds.promptDialog(query=True, text=True)
             if name:
-                preset_path = os.path.join(self.get_preset_dir(), name + ".json")
+                preset_path = os.path.join(self.get_preset_dir(), name + _JSON_SUFFIX)
 
                 if os.path.exists(preset_path):
                     confirm_result = cmds.confirmDialog(
@@ -557,10 +792,13 @@ class ViewportCapture:
                         return  
 
                 try:
-                    with open(preset_path, 'w') as f:
-                        json.dump(self.last_captured_settings, f, indent=4)
+                    with open(preset_path, 'wb') as f:
+                        f.write(_json_dumps(self.last_captured_settings, indent=self.readable_presets))
+                    # Prime the parse cache with what was just written, so loading it back needs no parse
+                    self._parsed_preset_cache[preset_path] = (os.stat(preset_path).st_mtime_ns,
+                                                              self.last_captured_settings)
                     self.update_status("Preset '{}' saved".format(name))
-                    self.refresh_preset_list()
+                    self._add_preset(name)
                 except Exception as e:
                     self.update_status("Error saving preset: {}".format(e))
 
@@ -572,30 +810,42 @@ class ViewportCapture:
             self.update_status("No preset selected")
             return
 
-        preset_path = os.path.join(self.get_preset_dir(), selected[0] + ".json")
+        preset_path = os.path.join(self.get_preset_dir(), selected[0] + _JSON_SUFFIX)
         try:
-            with open(preset_path, 'r') as f:
-                settings = json.load(f)
-                self.last_captured_settings = settings
-                self.gpu_cache_enabled = settings.get('plugin_display', {}).get('gpuCache', False)
-                cmds.checkBox(self.gpu_checkbox, edit=True, value=self.gpu_cache_enabled)
-
-                # Generate the MEL script from these settings:
-                mel_code = self.settings_to_mel(settings)
+            settings = self._read_preset(preset_path)
+            self.last_captured_settings = settings
+            self.gpu_cache_enabled = settings.get('plugin_display', {}).get('gpuCache', False)
+            cmds.checkBox(self.gpu_checkbox, edit=True, value=self.gpu_cache_enabled)
 
-                # Display the MEL code in the scrollField
-                cmds.scrollField(self.result_field, edit=True, text=mel_code)
+            # Generate the MEL script from these settings:
+            mel_code = self.settings_to_mel(settings)
 
-                # Execute the MEL code in Maya
-                mel.eval(mel_code)
+            # Display the MEL code in the scrollField
+            cmds.scrollField(self.result_field, edit=True, text=mel_code)
 
-                # If you DO NOT want Python to apply anything, comment out the line below:
-                # self.apply_settings()
+            # Apply through the generated MEL only; running apply_settings as well would set everything twice
+            self._apply_via_mel(mel_code)
 
-                self.update_status("Preset '{}' loaded and applied".format(selected[0]))
+            self.update_status("Preset '{}' loaded and applied".format(selected[0]))
         except Exception as e:
             self.update_status("Error loading preset: {}".format(e))
 
+    def _read_preset(self, preset_path):
+        """Return the parsed preset file, reusing the cached parse while the file is unchanged."""
+        mtime = os.stat(preset_path).st_mtime_ns
+        cached = self._parsed_preset_cache.get(preset_path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        # One read and one parse; binary mode skips newline translation
+        with open(preset_path, 'rb') as f:
+            settings = _json_loads(f.read())
+        self._parsed_preset_cache[preset_path] = (mtime, settings)
+        return settings
+
+    def _apply_via_mel(self, mel_code):
+        """Apply settings by executing their generated MEL script in Maya."""
+        mel.eval(mel_code)
+
     def delete_preset(self, *args):
         """Delete the selected preset."""
         selected = cmds.textScrollList(self.preset_list, q=True, selectItem=True)
@@ -613,79 +863,240 @@ class ViewportCapture:
         )
 
         if result == 'Yes':
-            preset_path = os.path.join(self.get_preset_dir(), selected[0] + ".json")
+            preset_path = os.path.join(self.get_preset_dir(), selected[0] + _JSON_SUFFIX)
             try:
                 os.remove(preset_path)
+                self._parsed_preset_cache.pop(preset_path, None)
                 self.update_status("Preset '{}' deleted".format(selected[0]))
-                self.refresh_preset_list()
+                self._remove_preset(selected[0])
             except Exception as e:
                 self.update_status("Error deleting preset: {}".format(e))
 
     def refresh_preset_list(self):
-        """Refresh the preset list in the UI."""
-        cmds.textScrollList(self.preset_list, edit=True, removeAll=True)
+        """Refresh the preset list in the UI.
+
+        The directory is read on a background thread and the list is filled back on Maya's main thread.
+        """
         preset_dir = self.get_preset_dir()
-        if os.path.exists(preset_dir):
-            presets = [f[:-5] for f in os.listdir(preset_dir) if f.endswith('.json')]
-            if presets:
-                cmds.textScrollList(self.preset_list, edit=True, append=sorted(presets))
+        self._preset_generation += 1
+        self._preset_scan_generation = self._preset_generation
+        scan = threading.Thread(target=self._scan_presets_worker, args=(preset_dir, self._preset_generation))
+        scan.daemon = True
+        scan.start()
+
+    def _scan_presets_worker(self, preset_dir, generation):
+        """Read the preset names off the main thread and hand them to _show_presets."""
+        try:
+            # The directory mtime changes whenever a preset is added or removed, so an unchanged
+            # (path, mtime) pair means the last scan is still valid
+            key = (preset_dir, os.stat(preset_dir).st_mtime_ns)
+            if key == self._preset_names_key:
+                presets = self._preset_names
+            else:
+                presets = self._scan_preset_names(preset_dir)
+        except OSError:
+            key = None
+            presets = []
+        # Maya UI commands are only safe on the main thread
+        maya.utils.executeDeferred(self._show_presets, generation, key, presets)
+
+    def _show_presets(self, generation, key, presets):
+        """Store a finished scan and show it in the preset list."""
+        if generation != self._preset_generation:
+            # The list changed while this scan was running, so its listing may be out of date. A newer
+            # scan will report on its own; otherwise (a save or delete happened) scan again.
+            if generation == self._preset_scan_generation:
+                self.refresh_preset_list()
+            return
+        self._preset_names_key = key
+        self._preset_names = presets
+        self._preset_name_set = set(presets)
+        if not cmds.textScrollList(self.preset_list, exists=True):
+            return
+        # Clear and repopulate the list in a single edit; with no presets only the clear is needed
+        if presets:
+            cmds.textScrollList(self.preset_list, edit=True, removeAll=True, append=presets)
+        else:
+            cmds.textScrollList(self.preset_list, edit=True, removeAll=True)
+
+    def _populate_presets(self):
+        """Fill the preset list the first time it is needed."""
+        if self._presets_loaded:
+            return
+        self._presets_loaded = True
+        self.refresh_preset_list()
+        self._start_preset_watch()
+
+    def _start_preset_watch(self):
+        """Watch the preset directory for added or removed presets, if watchdog is installed."""
+        if Observer is None or self._preset_observer is not None:
+            return
+        # This runs deferred, so the window may already have been closed
+        if not cmds.window(self.window_name, exists=True):
+            return
+        try:
+            preset_dir = self.get_preset_dir()
+            observer = Observer()
+            observer.schedule(_PresetDirHandler(self, preset_dir), preset_dir, recursive=False)
+            observer.daemon = True
+            # Stop watching once the window is closed; registered before the observer thread starts
+            # so a failure here cannot leave it running
+            cmds.scriptJob(uiDeleted=[self.window_name, self._stop_preset_watch], runOnce=True)
+            observer.start()
+        except Exception as e:
+            self.update_status("Warning: Could not watch preset directory: {}".format(e))
+            return
+        self._preset_observer = observer
+
+    def _stop_preset_watch(self):
+        """Stop the preset directory watcher."""
+        observer, self._preset_observer = self._preset_observer, None
+        if observer is not None:
+            observer.stop()
+
+    def _on_preset_file_event(self, preset_dir, name, added):
+        """Apply a preset file change reported by the directory watcher."""
+        # Drop events still queued from a directory the tool has since switched away from
+        if preset_dir != self._preset_dir or not cmds.textScrollList(self.preset_list, exists=True):
+            return
+        if added:
+            self._add_preset(name)
+        else:
+            self._remove_preset(name)
+
+    def _add_preset(self, name):
+        """Insert a newly saved preset into the list without rescanning the directory."""
+        if name in self._preset_name_set:
+            return
+        if self.sort_presets:
+            index = bisect.bisect(self._preset_names, name)
+        else:
+            index = len(self._preset_names)
+        self._preset_names.insert(index, name)
+        self._preset_name_set.add(name)
+        self._preset_generation += 1
+        # appendPosition is 1-based
+        cmds.textScrollList(self.preset_list, edit=True, appendPosition=(index + 1, name))
+
+    def _remove_preset(self, name):
+        """Remove a deleted preset from the list without rescanning the directory."""
+        if name not in self._preset_name_set:
+            return
+        self._preset_names.remove(name)
+        self._preset_name_set.discard(name)
+        self._preset_generation += 1
+        cmds.textScrollList(self.preset_list, edit=True, removeItem=name)
+
+    def _scan_preset_names(self, preset_dir):
+        """Return the names of the .json presets in preset_dir."""
+        # scandir's entries carry the file type, so no extra stat per preset
+        with os.scandir(preset_dir) as it:
+            presets = [e.name[:-_JSON_SUFFIX_LEN] for e in it if e.name.endswith(_JSON_SUFFIX) and e.is_file()]
+        if self.sort_presets:
+            presets.sort()
+        return presets
 
     def create_main_ui(self):
-        """Create the main user interface."""
-        if cmds.window(self.window_name, exists=True):
-            cmds.deleteUI(self.window_name)
-
-        cmds.window(self.window_name, title="Viewport Capture 2025 v3", widthHeight=(600, 800))
-
-        # Main layout
-        main_layout = cmds.columnLayout(adjustableColumn=True, rowSpacing=5)
-
-        cmds.text(label="Viewport Capture 2025 v3", font="boldLabelFont", height=30)
-        cmds.separator(height=10, style='double')
-
-        btn_layout = cmds.rowLayout(numberOfColumns=2, columnWidth2=(290, 290),
-                                    columnAttach=[(1, 'both', 5), (2, 'both', 5)])
-        cmds.button(label="Capture Active Viewport", command=self.capture_viewport)
-        cmds.button(label="Apply Settings", command=self.apply_settings)
-        cmds.setParent(main_layout)
-
-        # Options
-        options_layout = cmds.columnLayout(adjustableColumn=True)
-        cmds.setParent(options_layout)
-        # GPU Cache checkbox
-        self.gpu_checkbox = cmds.checkBox(
-            label="Enable GPU Cache",
-            value=self.gpu_cache_enabled,
-            changeCommand=self.toggle_gpu_cache,
-            align="left"
-        )
-        cmds.setParent(main_layout)
+        """Create the main user interface, or refresh this instance's window if it is still open."""
+        if self.preset_list and cmds.textScrollList(self.preset_list, exists=True):
+            # The layout is static, so only the parts that change are updated
+            self._refresh_dynamic()
+            cmds.showWindow(self.window_name)
+            return
 
-        self.status_label = cmds.text(label="Status: Ready", align='left')
-        cmds.separator(height=10)
+        self._build_static_ui()
+        cmds.showWindow(self.window_name)
+        # The new list starts empty; fill it once Maya is idle so a slow preset path doesn't hold up opening the window
+        self._presets_loaded = False
+        cmds.evalDeferred(self._populate_presets, lowestPriority=True)
+
+    def _refresh_dynamic(self):
+        """Update the status, GPU checkbox and preset list of an existing window."""
+        self.update_status("Ready")
+        cmds.checkBox(self.gpu_checkbox, edit=True, value=self.gpu_cache_enabled)
+        self.refresh_preset_list()
 
-        cmds.text(label="Captured Settings:", align='left')
-        self.result_field = cmds.scrollField(wordWrap=False, height=300,
-                                             text="// Capture a viewport to see settings")
+    def _build_static_ui(self):
+        """Build the window and its controls, replacing any window left from an earlier run."""
+        # Local bindings for the UI commands issued below
+        window, columnLayout, rowLayout = cmds.window, cmds.columnLayout, cmds.rowLayout
+        text, button, separator, setParent = cmds.text, cmds.button, cmds.separator, cmds.setParent
+        checkBox, scrollField, textScrollList = cmds.checkBox, cmds.scrollField, cmds.textScrollList
 
-        cmds.separator(height=20)
-        cmds.text(label="Presets:", align='left')
+        # Delete any window left from an earlier run directly instead of probing for it first
+        try:
+            cmds.deleteUI(self.window_name, window=True)
+        except RuntimeError:
+            pass
+
+        # Suspend viewport redraws while the controls are created
+        cmds.refresh(suspend=True)
+        try:
+            window(self.window_name, title="Viewport Capture 2025 v3", widthHeight=(600, 800))
+
+            # Main layout
+            columnLayout(adjustableColumn=True, rowSpacing=5)
+
+            text(label="Viewport Capture 2025 v3", font="boldLabelFont", height=30)
+            separator(height=10, style='double')
+
+            btn_layout = rowLayout(numberOfColumns=2, columnWidth2=(290, 290),
+                                   columnAttach=[(1, 'both', 5), (2, 'both', 5)])
+            button(label="Capture Active Viewport", command=self.capture_viewport)
+            button(label="Apply Settings", command=self.apply_settings)
+            setParent('..')
+
+            # Options
+            columnLayout(adjustableColumn=True)
+            # GPU Cache checkbox
+            self.gpu_checkbox = checkBox(
+                label="Enable GPU Cache",
+                value=self.gpu_cache_enabled,
+                changeCommand=self.toggle_gpu_cache,
+                align="left"
+            )
+            setParent('..')
+
+            self.status_label = text(label="Status: Ready", align='left')
+            separator(height=10)
+
+            text(label="Captured Settings:", align='left')
+            self.result_field = scrollField(wordWrap=False, height=300,
+                                            text="// Capture a viewport to see settings")
+
+            separator(height=20)
+            text(label="Presets:", align='left')
+
+            self.preset_list = textScrollList(height=150,
+                                              allowMultiSelection=False,
+                                              doubleClickCommand=self.load_preset)
+
+            preset_btn_layout = rowLayout(numberOfColumns=3,
+                                          columnWidth3=(190, 190, 190),
+                                          columnAttach=[(1, 'both', 5),
+                                                        (2, 'both', 5),
+                                                        (3, 'both', 5)])
+            button(label="Save New Preset", command=self.save_preset)
+            button(label="Load Selected", command=self.load_preset)
+            button(label="Delete Selected", command=self.delete_preset)
+            setParent('..')
+        finally:
+            cmds.refresh(suspend=False)
 
-        self.preset_list = cmds.textScrollList(height=150,
-                                               allowMultiSelection=False,
-                                               doubleClickCommand=self.load_preset)
 
-        preset_btn_layout = cmds.rowLayout(numberOfColumns=3,
-                                           columnWidth3=(190, 190, 190),
-                                           columnAttach=[(1, 'both', 5),
-                                                         (2, 'both', 5),
-                                                         (3, 'both', 5)])
-        cmds.button(label="Save New Preset", command=self.save_preset)
-        cmds.button(label="Load Selected", command=self.load_preset)
-        cmds.button(label="Delete Selected", command=self.delete_preset)
-        cmds.setParent(main_layout)
+# The tool instance opened by show(), kept so later calls reuse it
+_instance = None
 
-        cmds.showWindow(self.window_name)
+
+def show():
+    """Open the tool window, refreshing it in place if this session's instance already has it open."""
+    global _instance
+    if _instance is None:
+        _instance = ViewportCapture()
+    else:
+        _instance.create_main_ui()
+    return _instance
 
 if __name__ == "__main__":
-    ViewportCapture()
\ No newline at end of file
+    # Build the window once Maya finishes its current idle cycle instead of blocking the caller
+    maya.utils.executeDeferred(show)
\ No newline at end of file